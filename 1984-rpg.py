@@ -1,13 +1,106 @@
 import random
+import sys
 import time
 import os
+import types
+
+# Bound once so hot paths skip the module attribute lookup
+_randint = random.randint
+_choice = random.choice
+
+# Random events that can occur at unsafe locations
+_EVENTS = (
+    "A patrol of Thought Police officers walks by, scanning faces.",
+    "The telescreen suddenly announces a reduction in the chocolate ration.",
+    "Everyone around you freezes as an announcement begins about a captured traitor.",
+    "You notice someone watching you intently before they quickly look away.",
+    "A child in a Youth League uniform points at a man who is promptly arrested.",
+    "Party members gather for an impromptu Two Minutes Hate.",
+)
+
+# Dialogue options offered in each NPC conversation
+_OBRIEN_RESPONSES = (
+    "1. \"Very well. Glory to Big Brother.\" (Safe response)",
+    "2. \"I sometimes find it... difficult.\" (Risky response)",
+    "3. \"I have questions about the Brotherhood...\" (Dangerous response)",
+)
+_JULIA_RESPONSES = (
+    "1. Greet her formally, as a good Party member should",
+    "2. Pass her a secret note",
+    "3. Suggest meeting somewhere private",
+)
+_CHARRINGTON_RESPONSES = (
+    "1. \"Just browsing, thank you.\"",
+    "2. \"Do you have any items from before the Revolution?\"",
+    "3. \"I'm interested in the room upstairs.\"",
+)
+_PARSONS_RESPONSES = (
+    "1. \"Of course! Glory to Big Brother!\"",
+    "2. \"I've been too busy with work.\"",
+    "3. \"I'm not interested in Hate Week.\"",
+)
+_SYME_RESPONSES = (
+    "1. Express enthusiasm for his work",
+    "2. Ask technical questions about Newspeak",
+    "3. Question if limiting language limits human experience",
+)
+
+# Static screens, joined once at import time
+_TUTORIAL_TEXT = "\n".join((
+    "\n=== GAME TUTORIAL ===",
+    "\nIn 1984: Shadows of Oceania, you navigate a dangerous world where thinking the wrong thing can get you killed.",
+    "\nKey Concepts:",
+    "- Loyalty: Your commitment to the Party. Too low and you'll be suspected.",
+    "- Suspicion: How much the Party doubts you. Reach 100 and you'll be arrested.",
+    "- Thoughtcrime: Your level of rebellious thinking. Affects your actions and decisions.",
+    "- Health: Your physical condition. Reaches 0 and you die.",
+    "- Rebellion: Your progress toward meaningful resistance (if possible).",
+    "\nEach day, you will:",
+    "1. Perform your work duties",
+    "2. Navigate locations in Oceania",
+    "3. Interact with other characters",
+    "4. Make choices that affect your stats and story",
+    "\nRemember: In this world, there is no concept of winning in the traditional sense.",
+    "Your goal is to survive, maintain your humanity, and perhaps find small acts of rebellion.",
+    "Or perhaps total submission to the Party is the only way to survive...",
+    "\nGood luck. You'll need it.",
+))
+_ACTION_MENU = "\n".join((
+    "\n=== ACTIONS ===",
+    "1. Move to another location",
+    "2. Interact with someone here",
+    "3. Work on daily tasks",
+    "4. Search for items",
+    "5. Write in journal",
+    "6. View journal",
+    "7. Rest until tomorrow",
+    "8. Game information",
+    "9. Quit game",
+))
 
 class Character:
+    __slots__ = (
+        "name",
+        "occupation",
+        "loyalty",
+        "suspicion",
+        "suspicion_buffer",
+        "thoughtcrime",
+        "health",
+        "inventory",
+        "relationships",
+        "location",
+        "journal_entries",
+        "tasks_completed",
+        "rebellion_score",
+    )
+
     def __init__(self, name, occupation):
         self.name = name
         self.occupation = occupation
         self.loyalty = 50  # Loyalty to the Party (0-100)
         self.suspicion = 0  # How suspicious the Party is of you (0-100)
+        self.suspicion_buffer = 0  # Suspicion gain absorbed before it counts
         self.thoughtcrime = 0  # Level of thoughtcrime (0-100)
         self.health = 100
         self.inventory = []
@@ -19,23 +112,41 @@ class Character:
 
     def display_stats(self):
         """Display character statistics"""
-        print("\n" + "=" * 40)
-        print(f"Name: {self.name} | Occupation: {self.occupation}")
-        print(f"Location: {self.location}")
-        print("-" * 40)
-        print(f"Health: {self.health}/100")
-        print(f"Party Loyalty: {self.loyalty}/100")
-        print(f"Suspicion Level: {self.suspicion}/100")
-        print(f"Thoughtcrime Level: {self.thoughtcrime}/100")
-        print(f"Rebellion Score: {self.rebellion_score}/100")
-        print(f"Tasks Completed: {self.tasks_completed}")
-        print("=" * 40)
+        lines = [
+            "\n" + "=" * 40,
+            f"Name: {self.name} | Occupation: {self.occupation}",
+            f"Location: {self.location}",
+            "-" * 40,
+            f"Health: {self.health}/100",
+            f"Party Loyalty: {self.loyalty}/100",
+            f"Suspicion Level: {self.suspicion}/100",
+            f"Thoughtcrime Level: {self.thoughtcrime}/100",
+            f"Rebellion Score: {self.rebellion_score}/100",
+            f"Tasks Completed: {self.tasks_completed}",
+            "=" * 40,
+        ]
+        print("\n".join(lines))
+
+    def adjust(self, attr, delta, msg=None):
+        """Change a stat by delta, keeping it within 0-100"""
+        if attr == "suspicion" and delta > 0 and self.suspicion_buffer:
+            absorbed = min(delta, self.suspicion_buffer)
+            self.suspicion_buffer -= absorbed
+            delta -= absorbed
+            # The caller's message would name the full gain, so report what applied
+            if msg:
+                if delta:
+                    msg = f"Your record at the Ministry of Love shields you. Suspicion increased by {delta}."
+                else:
+                    msg = "Your record at the Ministry of Love shields you. Suspicion unchanged."
+        setattr(self, attr, min(100, max(0, getattr(self, attr) + delta)))
+        if msg:
+            print(msg)
 
     def write_journal(self, entry):
         """Add an entry to your secret journal"""
         self.journal_entries.append(entry)
-        self.thoughtcrime += 5
-        print("\nYou've written in your journal. Thoughtcrime level increased.")
+        self.adjust("thoughtcrime", 5, "\nYou've written in your journal. Thoughtcrime level increased.")
         
     def view_journal(self):
         """View your journal entries"""
@@ -43,57 +154,69 @@ class Character:
             print("\nYour journal is empty.")
             return
         
-        print("\n==== YOUR SECRET JOURNAL ====")
+        lines = ["\n==== YOUR SECRET JOURNAL ===="]
         for i, entry in enumerate(self.journal_entries, 1):
-            print(f"\nEntry {i}:")
-            print(f"{entry}")
-        print("\n============================")
+            lines.append(f"\nEntry {i}:")
+            lines.append(f"{entry}")
+        lines.append("\n============================")
+        print("\n".join(lines))
         
         # Risk of being caught
-        if random.randint(1, 10) == 1:
-            self.suspicion += 10
+        if _randint(1, 10) == 1:
             print("\nYou feel like you were being watched while reading your journal.")
-            print("Suspicion increased by 10!")
+            self.adjust("suspicion", 10, "Suspicion increased by 10!")
 
 class World:
+    __slots__ = (
+        "locations",
+        "npcs",
+        "npcs_by_location",
+        "current_date",
+        "two_minutes_hate_today",
+        "chocolate_ration",
+        "current_enemy",
+    )
+
     def __init__(self):
         self.locations = {
             "Victory Mansions": {
                 "description": "Your dilapidated apartment building. The telescreen on the wall continuously broadcasts Party propaganda.",
-                "connections": ["Ministry of Truth", "Victory Square"],
+                "connections": ("Ministry of Truth", "Victory Square"),
                 "safety": 3,  # 1-5 scale (5 is safest)
             },
             "Ministry of Truth": {
                 "description": "A massive pyramidal structure where you work rewriting historical documents to match Party narratives.",
-                "connections": ["Victory Mansions", "Victory Square", "Canteen"],
+                "connections": ("Victory Mansions", "Victory Square", "Canteen"),
                 "safety": 1,
             },
             "Canteen": {
                 "description": "A gray cafeteria serving tasteless Victory meals and Victory Gin.",
-                "connections": ["Ministry of Truth"],
+                "connections": ("Ministry of Truth",),
                 "safety": 2,
             },
             "Victory Square": {
                 "description": "The central square where public executions and rallies are held.",
-                "connections": ["Victory Mansions", "Ministry of Truth", "Prole District", "Charrington's Shop"],
+                "connections": ("Victory Mansions", "Ministry of Truth", "Prole District", "Charrington's Shop"),
                 "safety": 1,
             },
             "Prole District": {
                 "description": "The rundown area where the proles (working class) live with less surveillance.",
-                "connections": ["Victory Square", "Charrington's Shop"],
+                "connections": ("Victory Square", "Charrington's Shop"),
                 "safety": 4,
             },
             "Charrington's Shop": {
                 "description": "An antique shop run by an elderly man. It has a room upstairs without a telescreen.",
-                "connections": ["Victory Square", "Prole District"],
+                "connections": ("Victory Square", "Prole District"),
                 "safety": 3,
             },
             "Ministry of Love": {
                 "description": "The terrifying windowless building where enemies of the Party are taken. Room 101 is inside.",
-                "connections": [],  # No escape
+                "connections": (),  # No escape
                 "safety": 0,
             },
         }
+        # Map data is static; expose it read-only
+        self.locations = types.MappingProxyType(self.locations)
         
         self.npcs = {
             "O'Brien": {
@@ -122,6 +245,12 @@ class World:
                 "location": "Canteen",
             },
         }
+        self.npcs = types.MappingProxyType(self.npcs)
+        
+        # Index NPCs by location so lookups don't rescan every NPC each turn
+        self.npcs_by_location = {location: [] for location in self.locations}
+        for name, info in self.npcs.items():
+            self.npcs_by_location[info["location"]].append(name)
         
         self.current_date = "April 4th, 1984"
         self.two_minutes_hate_today = True
@@ -131,70 +260,166 @@ class World:
     def display_location(self, location):
         """Display information about the current location"""
         loc = self.locations[location]
-        print(f"\n=== {location} ===")
-        print(loc["description"])
+        print(f"\n=== {location} ===\n{loc['description']}")
         
         # Show available connections
-        print("\nYou can go to:")
-        for connection in loc["connections"]:
-            print(f"- {connection}")
+        print("\nYou can go to:" + "".join(f"\n- {c}" for c in loc["connections"]))
             
         # Show NPCs at this location
-        present_npcs = [name for name, info in self.npcs.items() if info["location"] == location]
+        present_npcs = self.npcs_by_location[location]
         if present_npcs:
-            print("\nPeople present:")
-            for npc in present_npcs:
-                print(f"- {npc}")
+            print("\nPeople present:" + "".join(f"\n- {npc}" for npc in present_npcs))
                 
         # Random event chance based on safety
         self._random_event(location)
     
+    def move_npc(self, name, new_location):
+        """Move an NPC to another location, keeping the location index in sync"""
+        npc = self.npcs[name]
+        self.npcs_by_location[npc["location"]].remove(name)
+        self.npcs_by_location[new_location].append(name)
+        npc["location"] = new_location
+    
     def _random_event(self, location):
         """Chance of random events based on location safety"""
         safety = self.locations[location]["safety"]
-        if random.randint(1, 10) > safety:
-            events = [
-                "A patrol of Thought Police officers walks by, scanning faces.",
-                "The telescreen suddenly announces a reduction in the chocolate ration.",
-                "Everyone around you freezes as an announcement begins about a captured traitor.",
-                "You notice someone watching you intently before they quickly look away.",
-                "A child in a Youth League uniform points at a man who is promptly arrested.",
-                "Party members gather for an impromptu Two Minutes Hate.",
-            ]
-            print(f"\n[EVENT] {random.choice(events)}")
+        if _randint(1, 10) > safety:
+            print(f"\n[EVENT] {_choice(_EVENTS)}")
 
 
 class Game:
+    __slots__ = ("world", "player", "game_over", "day", "tutorial_done", "ansi_console")
+
+    # Dispatch tables map a menu choice to the name of the method handling it
+    _MENU_ACTIONS = {
+        "1": "move_location",
+        "2": "interact_with_npc",
+        "3": "do_work",
+        "4": "search_items",
+        "5": "write_in_journal",
+        "6": "_view_journal_and_pause",
+        "7": "next_day",
+        "8": "show_help",
+        "9": "quit_game",
+    }
+    _OCCUPATIONS = {
+        "1": "Records Department Worker",
+        "2": "Maintenance Technician",
+        "3": "Junior Spy Instructor",
+        "4": "Fiction Department Writer",
+    }
+    _WORK_TASKS = {
+        "Records Department Worker": "records_department_work",
+        "Maintenance Technician": "maintenance_work",
+        "Junior Spy Instructor": "spy_instructor_work",
+        "Fiction Department Writer": "fiction_department_work",
+    }
+    _NPC_INTERACTIONS = {
+        "O'Brien": "obrien_interaction",
+        "Julia": "julia_interaction",
+        "Charrington": "charrington_interaction",
+        "Parsons": "parsons_interaction",
+        "Syme": "syme_interaction",
+    }
+    _OBRIEN_HANDLERS = {
+        "1": "_obrien_safe_response",
+        "2": "_obrien_risky_response",
+        "3": "_obrien_dangerous_response",
+    }
+    _JULIA_HANDLERS = {
+        "1": "_julia_formal_greeting",
+        "2": "_julia_secret_note",
+        "3": "_julia_private_meeting",
+    }
+    _CHARRINGTON_HANDLERS = {
+        "1": "_charrington_browse",
+        "2": "_charrington_antiques",
+        "3": "_charrington_upstairs_room",
+    }
+    _PARSONS_HANDLERS = {
+        "1": "_parsons_enthusiasm",
+        "2": "_parsons_too_busy",
+        "3": "_parsons_not_interested",
+    }
+    _SYME_HANDLERS = {
+        "1": "_syme_enthusiasm",
+        "2": "_syme_technical_questions",
+        "3": "_syme_question_language",
+    }
+
     def __init__(self):
         self.world = World()
         self.player = None
         self.game_over = False
         self.day = 1
         self.tutorial_done = False
+        self.ansi_console = self._enable_ansi_console()
+        
+    @staticmethod
+    def _enable_ansi_console():
+        """Make sure the console understands ANSI escape sequences"""
+        if os.name != 'nt':
+            return True
+        # Windows consoles need virtual terminal processing switched on once
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_ulong()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except (OSError, AttributeError):
+            return False
         
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-    def slow_print(self, text, delay=0.03):
-        """Print text slowly for dramatic effect"""
-        for char in text:
-            print(char, end='', flush=True)
-            time.sleep(delay)
-        print()
+        if self.ansi_console:
+            sys.stdout.write("\x1b[H\x1b[2J")
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
+        
+    def slow_print(self, text, delay=0.03, chunk=8):
+        """Print text slowly for dramatic effect, a few characters per write"""
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        for i in range(0, len(text), chunk):
+            piece = text[i:i + chunk]
+            write(piece)
+            flush()
+            time.sleep(delay * len(piece))
+        write("\n")
+        flush()
+        
+    def _pause(self, prompt="\nPress Enter to continue..."):
+        """Wait for the player to press Enter"""
+        input(prompt)
+        
+    def _read_choice(self, prompt, highest):
+        """Keep asking until the player enters a number from 1 to highest"""
+        while True:
+            text = input(prompt).strip()
+            if not text.isdecimal():
+                print("Please enter a number.")
+            elif 1 <= int(text) <= highest:
+                return int(text)
+            else:
+                print("Invalid choice. Try again.")
         
     def intro(self):
         """Display game introduction"""
         self.clear_screen()
-        self.slow_print("\n" + "=" * 60, 0.01)
+        print("\n" + "=" * 60)
         self.slow_print("1 9 8 4: S H A D O W S  O F  O C E A N I A", 0.05)
-        self.slow_print("=" * 60, 0.01)
+        print("=" * 60)
         self.slow_print("\nWAR IS PEACE | FREEDOM IS SLAVERY | IGNORANCE IS STRENGTH", 0.05)
         self.slow_print("\nWelcome to Oceania, citizen. The year is 1984.", 0.03)
         self.slow_print("Big Brother is watching. The Thought Police are listening.", 0.03)
         self.slow_print("Be careful what you think. Be careful what you say.", 0.03)
         self.slow_print("The wrong thought could be your last...", 0.03)
-        input("\nPress Enter to continue...")
+        self._pause()
         
         self.clear_screen()
         self.slow_print("\nYou wake up to the harsh sound of the telescreen.")
@@ -217,108 +442,59 @@ class Game:
         print("4. Fiction Department Writer (Ministry of Truth)")
         
         while True:
-            choice = input("\nEnter choice (1-4): ")
-            if choice == "1":
-                occupation = "Records Department Worker"
-                break
-            elif choice == "2":
-                occupation = "Maintenance Technician"
+            occupation = self._OCCUPATIONS.get(input("\nEnter choice (1-4): "))
+            if occupation:
                 break
-            elif choice == "3":
-                occupation = "Junior Spy Instructor"
-                break
-            elif choice == "4":
-                occupation = "Fiction Department Writer"
-                break
-            else:
-                print("Invalid choice. Please select 1-4.")
+            print("Invalid choice. Please select 1-4.")
         
         self.player = Character(name, occupation)
         
         # Adjust starting stats based on occupation
         if occupation == "Records Department Worker":
-            self.player.loyalty -= 5  # Working with changing history makes you question things
-            self.player.thoughtcrime += 10
+            self.player.adjust("loyalty", -5)  # Working with changing history makes you question things
+            self.player.adjust("thoughtcrime", 10)
         elif occupation == "Junior Spy Instructor":
-            self.player.loyalty += 15  # You're deeply involved in Party structure
-            self.player.suspicion -= 10
+            self.player.adjust("loyalty", 15)  # You're deeply involved in Party structure
+            self.player.suspicion_buffer = 10  # The first 10 suspicion you earn is overlooked
         elif occupation == "Fiction Department Writer":
-            self.player.thoughtcrime += 15  # Creative thinking leads to dangerous thoughts
+            self.player.adjust("thoughtcrime", 15)  # Creative thinking leads to dangerous thoughts
             
         print(f"\nWelcome, {name}. Your life as a {occupation} is about to change...")
         self.player.display_stats()
-        input("\nPress Enter to begin your journey...")
+        self._pause("\nPress Enter to begin your journey...")
     
     def tutorial(self):
         """Game tutorial"""
         self.clear_screen()
-        print("\n=== GAME TUTORIAL ===")
-        print("\nIn 1984: Shadows of Oceania, you navigate a dangerous world where thinking the wrong thing can get you killed.")
-        print("\nKey Concepts:")
-        print("- Loyalty: Your commitment to the Party. Too low and you'll be suspected.")
-        print("- Suspicion: How much the Party doubts you. Reach 100 and you'll be arrested.")
-        print("- Thoughtcrime: Your level of rebellious thinking. Affects your actions and decisions.")
-        print("- Health: Your physical condition. Reaches 0 and you die.")
-        print("- Rebellion: Your progress toward meaningful resistance (if possible).")
-        
-        print("\nEach day, you will:")
-        print("1. Perform your work duties")
-        print("2. Navigate locations in Oceania")
-        print("3. Interact with other characters")
-        print("4. Make choices that affect your stats and story")
-        
-        print("\nRemember: In this world, there is no concept of winning in the traditional sense.")
-        print("Your goal is to survive, maintain your humanity, and perhaps find small acts of rebellion.")
-        print("Or perhaps total submission to the Party is the only way to survive...")
-        
-        print("\nGood luck. You'll need it.")
-        input("\nPress Enter to start Day 1...")
+        print(_TUTORIAL_TEXT)
+        self._pause("\nPress Enter to start Day 1...")
         self.tutorial_done = True
     
     def main_menu(self):
         """Display main menu"""
         self.clear_screen()
-        print(f"\n=== DAY {self.day}: {self.world.current_date} ===")
-        print(f"Current Enemy of Oceania: {self.world.current_enemy}")
+        print(
+            f"\n=== DAY {self.day}: {self.world.current_date} ===\n"
+            f"Current Enemy of Oceania: {self.world.current_enemy}"
+        )
         
         self.player.display_stats()
         self.world.display_location(self.player.location)
         
-        print("\n=== ACTIONS ===")
-        print("1. Move to another location")
-        print("2. Interact with someone here")
-        print("3. Work on daily tasks")
-        print("4. Search for items")
-        print("5. Write in journal")
-        print("6. View journal")
-        print("7. Rest until tomorrow")
-        print("8. Game information")
-        print("9. Quit game")
+        print(_ACTION_MENU)
         
         choice = input("\nWhat will you do? ")
-        
-        if choice == "1":
-            self.move_location()
-        elif choice == "2":
-            self.interact_with_npc()
-        elif choice == "3":
-            self.do_work()
-        elif choice == "4":
-            self.search_items()
-        elif choice == "5":
-            self.write_in_journal()
-        elif choice == "6":
-            self.player.view_journal()
-            input("\nPress Enter to continue...")
-        elif choice == "7":
-            self.next_day()
-        elif choice == "8":
-            self.show_help()
-        elif choice == "9":
-            self.quit_game()
-        else:
-            print("Invalid choice. Try again.")
-            input("\nPress Enter to continue...")
+        getattr(self, self._MENU_ACTIONS.get(choice, "_invalid_menu_choice"))()
+    
+    def _view_journal_and_pause(self):
+        """View the journal and wait for the player"""
+        self.player.view_journal()
+        self._pause()
+    
+    def _invalid_menu_choice(self):
+        """Handle an unrecognized main menu choice"""
+        print("Invalid choice. Try again.")
+        self._pause()
     
     def move_location(self):
         """Move to a different location"""
@@ -333,39 +509,31 @@ class Game:
             print(f"{i}. {location}")
         print(f"{len(connections) + 1}. Stay at {current}")
         
-        while True:
-            try:
-                choice = int(input("\nEnter choice: "))
-                if 1 <= choice <= len(connections):
-                    new_location = connections[choice - 1]
-                    
-                    # Travel risk check
-                    if self.player.suspicion > 70 and random.randint(1, 10) <= 3:
-                        print("\nAs you're traveling, you notice you're being followed by someone in a black coat.")
-                        print("Your suspicion level is very high. Be careful.")
-                        self.player.suspicion += 5
-                    
-                    self.player.location = new_location
-                    print(f"\nYou travel to {new_location}.")
-                    break
-                elif choice == len(connections) + 1:
-                    print(f"\nYou decide to stay at {current}.")
-                    break
-                else:
-                    print("Invalid choice. Try again.")
-            except ValueError:
-                print("Please enter a number.")
+        choice = self._read_choice("\nEnter choice: ", len(connections) + 1)
+        if choice <= len(connections):
+            new_location = connections[choice - 1]
+            
+            # Travel risk check
+            if self.player.suspicion > 70 and _randint(1, 10) <= 3:
+                print("\nAs you're traveling, you notice you're being followed by someone in a black coat.")
+                print("Your suspicion level is very high. Be careful.")
+                self.player.adjust("suspicion", 5)
+            
+            self.player.location = new_location
+            print(f"\nYou travel to {new_location}.")
+        else:
+            print(f"\nYou decide to stay at {current}.")
         
-        input("\nPress Enter to continue...")
+        self._pause()
     
     def interact_with_npc(self):
         """Interact with NPCs at the current location"""
         location = self.player.location
-        present_npcs = [name for name, info in self.world.npcs.items() if info["location"] == location]
+        present_npcs = self.world.npcs_by_location[location]
         
         if not present_npcs:
             print("\nThere's no one here to interact with.")
-            input("\nPress Enter to continue...")
+            self._pause()
             return
             
         print("\n=== INTERACT ===")
@@ -375,22 +543,13 @@ class Game:
             print(f"{i}. {npc}")
         print(f"{len(present_npcs) + 1}. No one")
         
-        while True:
-            try:
-                choice = int(input("\nEnter choice: "))
-                if 1 <= choice <= len(present_npcs):
-                    npc_name = present_npcs[choice - 1]
-                    self.npc_interaction(npc_name)
-                    break
-                elif choice == len(present_npcs) + 1:
-                    print("\nYou decide not to speak with anyone.")
-                    break
-                else:
-                    print("Invalid choice. Try again.")
-            except ValueError:
-                print("Please enter a number.")
+        choice = self._read_choice("\nEnter choice: ", len(present_npcs) + 1)
+        if choice <= len(present_npcs):
+            self.npc_interaction(present_npcs[choice - 1])
+        else:
+            print("\nYou decide not to speak with anyone.")
                 
-        input("\nPress Enter to continue...")
+        self._pause()
     
     def npc_interaction(self, npc_name):
         """Handle interaction with a specific NPC"""
@@ -400,294 +559,277 @@ class Game:
         print(npc["description"])
         
         # Different dialogue options based on NPC
-        if npc_name == "O'Brien":
-            self.obrien_interaction()
-        elif npc_name == "Julia":
-            self.julia_interaction()
-        elif npc_name == "Charrington":
-            self.charrington_interaction()
-        elif npc_name == "Parsons":
-            self.parsons_interaction()
-        elif npc_name == "Syme":
-            self.syme_interaction()
+        interaction = self._NPC_INTERACTIONS.get(npc_name)
+        if interaction:
+            getattr(self, interaction)()
     
     def obrien_interaction(self):
         """Interaction with O'Brien"""
         print("\nO'Brien nods to you with a slight smile.")
         print("\"Ah, comrade. How goes your work for the Party?\"")
         
-        print("\n1. \"Very well. Glory to Big Brother.\" (Safe response)")
-        print("2. \"I sometimes find it... difficult.\" (Risky response)")
-        print("3. \"I have questions about the Brotherhood...\" (Dangerous response)")
+        print("\n" + "\n".join(_OBRIEN_RESPONSES))
         
         choice = input("\nYour response: ")
-        
-        if choice == "1":
-            print("\nO'Brien nods approvingly.")
-            print("\"The Party appreciates your dedication, comrade.\"")
-            self.player.loyalty += 5
-            print("Loyalty increased by 5.")
-        elif choice == "2":
-            print("\nO'Brien's eyes narrow slightly, then he smiles.")
-            print("\"We all have our burdens to bear for the Party. Perhaps we should discuss this further sometime.\"")
-            if self.player.thoughtcrime > 30:
-                print("He subtly hands you a note with his address.")
-                self.player.inventory.append("O'Brien's address")
-                print("'O'Brien's address' added to inventory.")
-            self.player.suspicion += 5
-            print("Suspicion increased by 5.")
-        elif choice == "3":
-            print("\nO'Brien's face becomes completely blank.")
-            print("\"I'm not sure I understand what you're referring to, comrade.\"")
-            print("He walks away, and you notice someone watching you from across the room.")
-            self.player.suspicion += 15
-            print("Suspicion increased by 15!")
-            
-            # Potentially harmful consequence
-            if random.randint(1, 3) == 1:
-                print("\nLater that day, you're called in for questioning about your work.")
-                print("The interrogator seems particularly interested in your political views.")
-                self.player.suspicion += 10
-                print("Suspicion increased by another 10!")
-        else:
-            print("\nYou mumble something incoherent.")
-            print("O'Brien gives you a strange look and walks away.")
+        getattr(self, self._OBRIEN_HANDLERS.get(choice, "_obrien_no_response"))()
+    
+    def _obrien_safe_response(self):
+        """Pledge loyalty to O'Brien"""
+        print("\nO'Brien nods approvingly.")
+        print("\"The Party appreciates your dedication, comrade.\"")
+        self.player.adjust("loyalty", 5, "Loyalty increased by 5.")
+    
+    def _obrien_risky_response(self):
+        """Admit doubts to O'Brien"""
+        print("\nO'Brien's eyes narrow slightly, then he smiles.")
+        print("\"We all have our burdens to bear for the Party. Perhaps we should discuss this further sometime.\"")
+        if self.player.thoughtcrime > 30:
+            print("He subtly hands you a note with his address.")
+            self.player.inventory.append("O'Brien's address")
+            print("'O'Brien's address' added to inventory.")
+        self.player.adjust("suspicion", 5, "Suspicion increased by 5.")
+    
+    def _obrien_dangerous_response(self):
+        """Ask O'Brien about the Brotherhood"""
+        print("\nO'Brien's face becomes completely blank.")
+        print("\"I'm not sure I understand what you're referring to, comrade.\"")
+        print("He walks away, and you notice someone watching you from across the room.")
+        self.player.adjust("suspicion", 15, "Suspicion increased by 15!")
+        
+        # Potentially harmful consequence
+        if _randint(1, 3) == 1:
+            print("\nLater that day, you're called in for questioning about your work.")
+            print("The interrogator seems particularly interested in your political views.")
+            self.player.adjust("suspicion", 10, "Suspicion increased by another 10!")
+    
+    def _obrien_no_response(self):
+        """Fail to answer O'Brien"""
+        print("\nYou mumble something incoherent.")
+        print("O'Brien gives you a strange look and walks away.")
             
     def julia_interaction(self):
         """Interaction with Julia"""
         # This will be implemented with romance options and resistance plotting
         print("\n\"Hello,\" Julia says, glancing around to see if anyone is watching.")
         
-        print("\n1. Greet her formally, as a good Party member should")
-        print("2. Pass her a secret note")
-        print("3. Suggest meeting somewhere private")
+        print("\n" + "\n".join(_JULIA_RESPONSES))
         
         choice = input("\nYour response: ")
-        
-        if choice == "1":
-            print("\nYou greet Julia with the proper Party salute.")
-            print("She seems disappointed but returns the gesture perfectly.")
-            self.player.loyalty += 5
-            print("Loyalty increased by 5.")
-        elif choice == "2":
-            if "Julia's trust" not in self.player.relationships:
-                print("\nYou discreetly slip her a note. She takes it without looking at you.")
-                print("Later, you find a note in your pocket: \"Prole District, tomorrow.\"")
-                self.player.relationships["Julia's trust"] = 10
-                print("You've established a connection with Julia.")
-                self.player.thoughtcrime += 10
-                self.player.suspicion += 5
-                print("Thoughtcrime increased by 10.")
-                print("Suspicion increased by 5.")
-            else:
-                print("\nShe takes your note and passes one back.")
-                print("\"Charrington's Shop, upstairs room. Three days from now.\"")
-                self.player.relationships["Julia's trust"] += 10
-                self.player.thoughtcrime += 5
-                print("Your relationship with Julia has deepened.")
-                print("Thoughtcrime increased by 5.")
-        elif choice == "3":
-            if "Julia's trust" in self.player.relationships and self.player.relationships["Julia's trust"] > 20:
-                print("\nYou whisper about meeting somewhere without telescreens.")
-                print("She nods slightly and whispers back, \"I know a place. Follow me later.\"")
-                
-                print("\nYou spend several precious hours with Julia, away from the Party's eyes.")
-                print("For a brief moment, you both feel truly human again.")
-                self.player.health += 10
-                self.player.thoughtcrime += 15
-                self.player.rebellion_score += 5
-                print("Health improved by 10.")
-                print("Thoughtcrime increased by 15.")
-                print("Rebellion score increased by 5.")
-            else:
-                print("\nShe looks alarmed at your suggestion.")
-                print("\"I don't know what you mean, comrade. We should all be where the Party needs us.\"")
-                print("She walks away quickly. You realize you've made a mistake.")
-                self.player.suspicion += 10
-                print("Suspicion increased by 10!")
+        getattr(self, self._JULIA_HANDLERS.get(choice, "_julia_no_response"))()
+    
+    def _julia_formal_greeting(self):
+        """Greet Julia as a good Party member"""
+        print("\nYou greet Julia with the proper Party salute.")
+        print("She seems disappointed but returns the gesture perfectly.")
+        self.player.adjust("loyalty", 5, "Loyalty increased by 5.")
+    
+    def _julia_secret_note(self):
+        """Exchange secret notes with Julia"""
+        if "Julia's trust" not in self.player.relationships:
+            print("\nYou discreetly slip her a note. She takes it without looking at you.")
+            print("Later, you find a note in your pocket: \"Prole District, tomorrow.\"")
+            self.player.relationships["Julia's trust"] = 10
+            print("You've established a connection with Julia.")
+            self.player.adjust("thoughtcrime", 10, "Thoughtcrime increased by 10.")
+            self.player.adjust("suspicion", 5, "Suspicion increased by 5.")
+        else:
+            print("\nShe takes your note and passes one back.")
+            print("\"Charrington's Shop, upstairs room. Three days from now.\"")
+            self.player.relationships["Julia's trust"] += 10
+            print("Your relationship with Julia has deepened.")
+            self.player.adjust("thoughtcrime", 5, "Thoughtcrime increased by 5.")
+    
+    def _julia_private_meeting(self):
+        """Suggest meeting Julia in private"""
+        if "Julia's trust" in self.player.relationships and self.player.relationships["Julia's trust"] > 20:
+            print("\nYou whisper about meeting somewhere without telescreens.")
+            print("She nods slightly and whispers back, \"I know a place. Follow me later.\"")
+            
+            print("\nYou spend several precious hours with Julia, away from the Party's eyes.")
+            print("For a brief moment, you both feel truly human again.")
+            self.player.adjust("health", 10, "Health improved by 10.")
+            self.player.adjust("thoughtcrime", 15, "Thoughtcrime increased by 15.")
+            self.player.adjust("rebellion_score", 5, "Rebellion score increased by 5.")
         else:
-            print("\nYou say nothing coherent. Julia gives you an odd look and walks away.")
+            print("\nShe looks alarmed at your suggestion.")
+            print("\"I don't know what you mean, comrade. We should all be where the Party needs us.\"")
+            print("She walks away quickly. You realize you've made a mistake.")
+            self.player.adjust("suspicion", 10, "Suspicion increased by 10!")
+    
+    def _julia_no_response(self):
+        """Fail to answer Julia"""
+        print("\nYou say nothing coherent. Julia gives you an odd look and walks away.")
     
     def charrington_interaction(self):
         """Interaction with Mr. Charrington"""
         print("\nThe old shopkeeper smiles warmly at you.")
         print("\"Looking for any particular antiques today?\"")
         
-        print("\n1. \"Just browsing, thank you.\"")
-        print("2. \"Do you have any items from before the Revolution?\"")
-        print("3. \"I'm interested in the room upstairs.\"")
+        print("\n" + "\n".join(_CHARRINGTON_RESPONSES))
         
         choice = input("\nYour response: ")
-        
-        if choice == "1":
-            print("\nCharrington nods. \"Take your time, plenty to see.\"")
-            print("You browse the dusty shelves filled with useless trinkets.")
-            
-            # Chance to find something
-            if random.randint(1, 3) == 1:
-                print("\nYou notice a small coral paperweight with a piece of coral inside.")
-                print("It seems to be a beautiful relic from the past.")
-                
-                print("\n1. Purchase it")
-                print("2. Leave it be")
-                
-                subchoice = input("\nYour choice: ")
-                if subchoice == "1":
-                    print("\nYou buy the paperweight. It reminds you of a world before the Party.")
-                    self.player.inventory.append("Coral paperweight")
-                    self.player.thoughtcrime += 5
-                    print("'Coral paperweight' added to inventory.")
-                    print("Thoughtcrime increased by 5.")
-                else:
-                    print("\nYou decide it's safer not to possess such items.")
+        getattr(self, self._CHARRINGTON_HANDLERS.get(choice, "_charrington_no_response"))()
+    
+    def _charrington_browse(self):
+        """Browse Charrington's shelves"""
+        print("\nCharrington nods. \"Take your time, plenty to see.\"")
+        print("You browse the dusty shelves filled with useless trinkets.")
+        
+        # Chance to find something
+        if _randint(1, 3) == 1:
+            print("\nYou notice a small coral paperweight with a piece of coral inside.")
+            print("It seems to be a beautiful relic from the past.")
             
-        elif choice == "2":
-            print("\nCharrington's eyes light up.")
-            print("\"Oh yes, a few things here and there. The Party doesn't mind these old trinkets.\"")
+            print("\n1. Purchase it")
+            print("2. Leave it be")
             
-            if "Charrington trust" not in self.player.relationships:
-                self.player.relationships["Charrington trust"] = 5
-                print("You've established a rapport with Mr. Charrington.")
+            subchoice = input("\nYour choice: ")
+            if subchoice == "1":
+                print("\nYou buy the paperweight. It reminds you of a world before the Party.")
+                self.player.inventory.append("Coral paperweight")
+                print("'Coral paperweight' added to inventory.")
+                self.player.adjust("thoughtcrime", 5, "Thoughtcrime increased by 5.")
             else:
-                self.player.relationships["Charrington trust"] += 5
-                print("Your relationship with Mr. Charrington has improved.")
-                
-            print("\nHe shows you a few items, including an old rhyme book.")
-            self.player.thoughtcrime += 5
-            self.player.suspicion += 5
-            print("Thoughtcrime increased by 5.")
-            print("Suspicion increased by 5.")
+                print("\nYou decide it's safer not to possess such items.")
+    
+    def _charrington_antiques(self):
+        """Ask Charrington about pre-Revolution items"""
+        print("\nCharrington's eyes light up.")
+        print("\"Oh yes, a few things here and there. The Party doesn't mind these old trinkets.\"")
+        
+        if "Charrington trust" not in self.player.relationships:
+            self.player.relationships["Charrington trust"] = 5
+            print("You've established a rapport with Mr. Charrington.")
+        else:
+            self.player.relationships["Charrington trust"] += 5
+            print("Your relationship with Mr. Charrington has improved.")
             
-        elif choice == "3":
-            if "Julia's trust" in self.player.relationships and self.player.relationships["Julia's trust"] > 30:
-                print("\nCharrington smiles knowingly.")
-                print("\"Ah yes, a quiet place. No telescreens up there. Two dollars a week.\"")
-                print("\nYou arrange to rent the room. It could be a sanctuary from the Party's eyes.")
-                self.player.inventory.append("Key to upstairs room")
-                self.player.thoughtcrime += 10
-                self.player.suspicion += 10
-                self.player.rebellion_score += 10
-                print("'Key to upstairs room' added to inventory.")
-                print("Thoughtcrime increased by 10.")
-                print("Suspicion increased by 10.")
-                print("Rebellion score increased by 10.")
-                
-                # What you don't know is that the room is bugged...
-            else:
-                print("\nCharrington looks confused.")
-                print("\"The upstairs? Just storage, nothing interesting there.\"")
-                print("He seems suspicious of your question.")
-                self.player.suspicion += 5
-                print("Suspicion increased by 5.")
+        print("\nHe shows you a few items, including an old rhyme book.")
+        self.player.adjust("thoughtcrime", 5, "Thoughtcrime increased by 5.")
+        self.player.adjust("suspicion", 5, "Suspicion increased by 5.")
+    
+    def _charrington_upstairs_room(self):
+        """Ask Charrington about the room upstairs"""
+        if "Julia's trust" in self.player.relationships and self.player.relationships["Julia's trust"] > 30:
+            print("\nCharrington smiles knowingly.")
+            print("\"Ah yes, a quiet place. No telescreens up there. Two dollars a week.\"")
+            print("\nYou arrange to rent the room. It could be a sanctuary from the Party's eyes.")
+            self.player.inventory.append("Key to upstairs room")
+            print("'Key to upstairs room' added to inventory.")
+            self.player.adjust("thoughtcrime", 10, "Thoughtcrime increased by 10.")
+            self.player.adjust("suspicion", 10, "Suspicion increased by 10.")
+            self.player.adjust("rebellion_score", 10, "Rebellion score increased by 10.")
+            
+            # What you don't know is that the room is bugged...
         else:
-            print("\nYou mumble something and Charrington nods politely.")
+            print("\nCharrington looks confused.")
+            print("\"The upstairs? Just storage, nothing interesting there.\"")
+            print("He seems suspicious of your question.")
+            self.player.adjust("suspicion", 5, "Suspicion increased by 5.")
+    
+    def _charrington_no_response(self):
+        """Fail to answer Charrington"""
+        print("\nYou mumble something and Charrington nods politely.")
     
     def parsons_interaction(self):
         """Interaction with Parsons"""
         print("\nParsons greets you with excessive enthusiasm.")
         print("\"Comrade! Have you contributed to the Hate Week preparations yet?\"")
         
-        print("\n1. \"Of course! Glory to Big Brother!\"")
-        print("2. \"I've been too busy with work.\"")
-        print("3. \"I'm not interested in Hate Week.\"")
+        print("\n" + "\n".join(_PARSONS_RESPONSES))
         
         choice = input("\nYour response: ")
-        
-        if choice == "1":
-            print("\nParsons beams with approval.")
-            print("\"That's the spirit! My little ones are so excited they're practicing their spying techniques!\"")
-            print("He laughs, not realizing how terrifying that sounds.")
-            self.player.loyalty += 5
-            print("Loyalty increased by 5.")
-            
-            if random.randint(1, 4) == 1:
-                print("\nParsons lowers his voice. \"Between you and me, I talk in my sleep sometimes.")
-                print("My little girl reported me for saying 'Down with Big Brother' in my sleep last week!\"")
-                print("He seems proud of his daughter's vigilance, unaware of his danger.")
-                self.player.thoughtcrime += 5
-                print("Thoughtcrime increased by 5.")
-                
-        elif choice == "2":
-            print("\nParsons looks disappointed.")
-            print("\"Too busy? No one's too busy for the Party! I'll put your name down for extra duty!\"")
-            print("Before you can protest, he's already making a note in his book.")
-            self.player.loyalty += 10
-            self.player.health -= 5
-            print("Loyalty increased by 10.")
-            print("Health decreased by 5 due to extra work.")
-            
-        elif choice == "3":
-            print("\nParsons looks shocked, then laughs nervously.")
-            print("\"That's a good joke, comrade! Of course you're interested, we all are!\"")
-            print("He walks away but glances back at you with concern.")
-            self.player.suspicion += 15
-            print("Suspicion increased by 15!")
-            
-        else:
-            print("\nYou give a noncommittal response. Parsons seems satisfied enough.")
+        getattr(self, self._PARSONS_HANDLERS.get(choice, "_parsons_no_response"))()
+    
+    def _parsons_enthusiasm(self):
+        """Show enthusiasm for Hate Week"""
+        print("\nParsons beams with approval.")
+        print("\"That's the spirit! My little ones are so excited they're practicing their spying techniques!\"")
+        print("He laughs, not realizing how terrifying that sounds.")
+        self.player.adjust("loyalty", 5, "Loyalty increased by 5.")
+        
+        if _randint(1, 4) == 1:
+            print("\nParsons lowers his voice. \"Between you and me, I talk in my sleep sometimes.")
+            print("My little girl reported me for saying 'Down with Big Brother' in my sleep last week!\"")
+            print("He seems proud of his daughter's vigilance, unaware of his danger.")
+            self.player.adjust("thoughtcrime", 5, "Thoughtcrime increased by 5.")
+    
+    def _parsons_too_busy(self):
+        """Tell Parsons you are too busy"""
+        print("\nParsons looks disappointed.")
+        print("\"Too busy? No one's too busy for the Party! I'll put your name down for extra duty!\"")
+        print("Before you can protest, he's already making a note in his book.")
+        self.player.adjust("loyalty", 10, "Loyalty increased by 10.")
+        self.player.adjust("health", -5, "Health decreased by 5 due to extra work.")
+    
+    def _parsons_not_interested(self):
+        """Tell Parsons you don't care about Hate Week"""
+        print("\nParsons looks shocked, then laughs nervously.")
+        print("\"That's a good joke, comrade! Of course you're interested, we all are!\"")
+        print("He walks away but glances back at you with concern.")
+        self.player.adjust("suspicion", 15, "Suspicion increased by 15!")
+    
+    def _parsons_no_response(self):
+        """Give Parsons a noncommittal answer"""
+        print("\nYou give a noncommittal response. Parsons seems satisfied enough.")
     
     def syme_interaction(self):
         """Interaction with Syme"""
         print("\nSyme is excited to tell you about his work on the Newspeak dictionary.")
         print("\"We're removing thousands more words this year! Thoughtcrime will be literally impossible!\"")
         
-        print("\n1. Express enthusiasm for his work")
-        print("2. Ask technical questions about Newspeak")
-        print("3. Question if limiting language limits human experience")
+        print("\n" + "\n".join(_SYME_RESPONSES))
         
         choice = input("\nYour response: ")
+        getattr(self, self._SYME_HANDLERS.get(choice, "_syme_no_response"))()
+    
+    def _syme_enthusiasm(self):
+        """Praise Syme's work"""
+        print("\nYou tell Syme his work is vital to the Party's goals.")
+        print("He nods eagerly. \"The Eleventh Edition will be perfect! No more unnecessary words!\"")
+        self.player.adjust("loyalty", 5, "Loyalty increased by 5.")
+    
+    def _syme_technical_questions(self):
+        """Ask Syme about Newspeak"""
+        print("\nYou ask Syme about the technical aspects of vocabulary reduction.")
+        print("He launches into a passionate explanation of how they're eliminating synonyms.")
+        print("\"Why have 'excellent', 'splendid', and 'great' when 'plusgood' and 'doubleplusgood' suffice?\"")
         
-        if choice == "1":
-            print("\nYou tell Syme his work is vital to the Party's goals.")
-            print("He nods eagerly. \"The Eleventh Edition will be perfect! No more unnecessary words!\"")
-            self.player.loyalty += 5
-            print("Loyalty increased by 5.")
-        elif choice == "2":
-            print("\nYou ask Syme about the technical aspects of vocabulary reduction.")
-            print("He launches into a passionate explanation of how they're eliminating synonyms.")
-            print("\"Why have 'excellent', 'splendid', and 'great' when 'plusgood' and 'doubleplusgood' suffice?\"")
-            
-            self.player.thoughtcrime += 5
-            print("Thoughtcrime increased by 5 - his explanation makes you realize what's being lost.")
-            
-            # Foreshadowing
-            print("\nAs Syme talks, you realize he understands too well what the Party is doing.")
-            print("You remember that people who understand too much often disappear...")
-            
-        elif choice == "3":
-            print("\nYou carefully ask if reducing vocabulary might limit certain types of thought.")
-            print("\nSyme stares at you intensely. \"That's precisely the point, don't you see?")
-            print("We're making thoughtcrime impossible because there will be no words to express it!\"")
-            
-            print("\nHis candor is frightening. He's too intelligent, too perceptive about the Party's goals.")
-            print("You're certain Syme will be vaporized eventually, despite his loyalty.")
-            
-            self.player.thoughtcrime += 10
-            self.player.suspicion += 5
-            print("Thoughtcrime increased by 10.")
-            print("Suspicion increased by 5.")
-            
-        else:
-            print("\nYou nod along without saying much. Syme eventually finds someone else to talk to.")
+        self.player.adjust("thoughtcrime", 5, "Thoughtcrime increased by 5 - his explanation makes you realize what's being lost.")
+        
+        # Foreshadowing
+        print("\nAs Syme talks, you realize he understands too well what the Party is doing.")
+        print("You remember that people who understand too much often disappear...")
+    
+    def _syme_question_language(self):
+        """Question whether Newspeak limits thought"""
+        print("\nYou carefully ask if reducing vocabulary might limit certain types of thought.")
+        print("\nSyme stares at you intensely. \"That's precisely the point, don't you see?")
+        print("We're making thoughtcrime impossible because there will be no words to express it!\"")
+        
+        print("\nHis candor is frightening. He's too intelligent, too perceptive about the Party's goals.")
+        print("You're certain Syme will be vaporized eventually, despite his loyalty.")
+        
+        self.player.adjust("thoughtcrime", 10, "Thoughtcrime increased by 10.")
+        self.player.adjust("suspicion", 5, "Suspicion increased by 5.")
+    
+    def _syme_no_response(self):
+        """Nod along with Syme"""
+        print("\nYou nod along without saying much. Syme eventually finds someone else to talk to.")
     
     def do_work(self):
         """Complete daily work tasks"""
         print("\n=== WORK TASKS ===")
         
         # Different tasks based on occupation
-        if self.player.occupation == "Records Department Worker":
-            self.records_department_work()
-        elif self.player.occupation == "Maintenance Technician":
-            self.maintenance_work()
-        elif self.player.occupation == "Junior Spy Instructor":
-            self.spy_instructor_work()
-        elif self.player.occupation == "Fiction Department Writer":
-            self.fiction_department_work()
+        task = self._WORK_TASKS.get(self.player.occupation)
+        if task:
+            getattr(self, task)()
             
         # Check if task completed today
         if self.player.location == "Ministry of Truth" or self.player.location == "Ministry of Love":
             self.player.tasks_completed += 1
             
             # Sometimes the Party changes history
-            if random.randint(1, 5) == 1:
+            if _randint(1, 5) == 1:
                 self.party_changes_history()
\ No newline at end of file
@@ -8,12 +8,14 @@ to control an aircraft.
 Dependencies:
 - MicroPython with WebSocket support
 - SSD1306 OLED display (128x64)
+- umsgpack (optional, MessagePack wire format; JSON is used without it)
 """
 
+import os
 import time
 import json
 import network
-from machine import Pin, I2C, ADC
+from machine import Pin, I2C, ADC, mem32
 import uasyncio as asyncio
 
 # Try to import the WebSocket client - this may vary by MicroPython implementation
@@ -22,6 +24,23 @@ try:
 except ImportError:
     import websockets.client as websockets
 
+# Prefer MessagePack on the wire; fall back to JSON if it isn't installed
+try:
+    import umsgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+    print("umsgpack not available, using JSON")
+
+# States may arrive zlib-compressed (once on the server for all clients)
+try:
+    import io
+    import deflate
+    HAS_DEFLATE = True
+except ImportError:
+    HAS_DEFLATE = False
+    print("deflate not available, compressed states will be skipped")
+
 # Try to import the display library
 try:
     import ssd1306
@@ -35,6 +54,19 @@ WIFI_SSID = "YourWiFiSSID"  # Change to your WiFi network
 WIFI_PASSWORD = "YourWiFiPassword"  # Change to your WiFi password
 SERVER_URL = "ws://flight-server.local:8080/ws"  # Change to your server address
 
+# With MessagePack, ask the server for binary frames: unlike text frames they
+# are handed over as-is, without a per-byte UTF-8 validation/decode pass
+if HAS_MSGPACK:
+    WS_URL = SERVER_URL + ("&" if "?" in SERVER_URL else "?") + "format=msgpack"
+else:
+    WS_URL = SERVER_URL
+
+# Input changes are queued and sent in batches to cut per-frame overhead
+INPUT_BATCH_MS = 200  # At most one input frame every 200 ms
+INPUT_KEEPALIVE_MS = 1000  # Resend the unchanged state this often while idle
+INPUT_SAMPLE_MS = 10  # Buttons are sampled (and presses latched) by their own task
+LOOP_PERIOD_MS = 50  # Send/display loop period, kept on a fixed ticks_ms schedule
+
 # Hardware pins (adjust for your specific board)
 # For ESP32 example setup
 BUTTON_UP = Pin(12, Pin.IN, Pin.PULL_UP)       # Up button
@@ -42,6 +74,16 @@ BUTTON_DOWN = Pin(14, Pin.IN, Pin.PULL_UP)     # Down button
 BUTTON_THROTTLE_UP = Pin(27, Pin.IN, Pin.PULL_UP)  # Throttle up
 BUTTON_THROTTLE_DOWN = Pin(26, Pin.IN, Pin.PULL_UP)  # Throttle down
 
+# On the original ESP32 all four buttons live in GPIO_IN_REG (GPIO 0-31), so a
+# single register read replaces four Pin.value() calls. Other chips (S2/S3/C3)
+# have a different register map and keep using the Pin objects.
+HAS_GPIO_REG = os.uname().machine.endswith("ESP32")
+GPIO_IN_REG = 0x3FF4403C
+MASK_UP = 1 << 12
+MASK_DOWN = 1 << 14
+MASK_THROTTLE_UP = 1 << 27
+MASK_THROTTLE_DOWN = 1 << 26
+
 # Joystick option (analog input)
 try:
     JOYSTICK_Y = ADC(Pin(32))
@@ -55,6 +97,21 @@ except:
 LED_CONNECTED = Pin(2, Pin.OUT)  # Blue LED for connection status
 LED_THROTTLE = Pin(4, Pin.OUT)   # Green LED for throttle
 
+# Bound methods and buffers used every tick, created once to avoid per-tick garbage
+_read_up = BUTTON_UP.value
+_read_down = BUTTON_DOWN.value
+_read_throttle_up = BUTTON_THROTTLE_UP.value
+_read_throttle_down = BUTTON_THROTTLE_DOWN.value
+_set_throttle_led = LED_THROTTLE.value
+JOYSTICK_DEAD_ZONE = 409  # Beyond 20% of the 2048 half-range means an offset of 410+
+_INPUT_KEYS = ("pitch_up", "pitch_down", "throttle_up", "throttle_down")
+_INPUT_STATE = {
+    "pitch_up": False,
+    "pitch_down": False,
+    "throttle_up": False,
+    "throttle_down": False
+}
+
 # OLED Display setup (I2C - SDA=21, SCL=22 for ESP32 default)
 if HAS_DISPLAY:
     i2c = I2C(0, scl=Pin(22), sda=Pin(21))
@@ -71,6 +128,73 @@ aircraft_data = {
     "throttle_level": 0.0
 }
 
+# Encode an outgoing message (binary MessagePack when available)
+def encode_message(obj):
+    if HAS_MSGPACK:
+        return umsgpack.dumps(obj)
+    return json.dumps(obj)
+
+# Decode an incoming message; binary frames carry MessagePack, text frames JSON
+def decode_message(message):
+    if isinstance(message, (bytes, bytearray)):
+        # A zlib header (0x78) can't start a MessagePack map or a JSON object
+        if message[0] == 0x78:
+            if not HAS_DEFLATE:
+                return {}
+            message = deflate.DeflateIO(io.BytesIO(message), deflate.ZLIB).read()
+        if message[0] == 0x7B:  # "{": JSON that was compressed into a binary frame
+            return json.loads(message)
+        return umsgpack.loads(message)
+    return json.loads(message)
+
+# Find our aircraft: O(1) when the server keys aircraft by id, else a list scan
+def find_aircraft(aircraft, aircraft_id):
+    if isinstance(aircraft, dict):
+        return aircraft.get(aircraft_id)
+    for entry in aircraft:
+        if entry["id"] == aircraft_id:
+            return entry
+    return None
+
+# Fields every aircraft record has, used to tell our record from other objects
+_AIRCRAFT_KEYS = ("x", "y", "vx", "vy")
+
+# Pull our aircraft's record out of a JSON state without parsing the rest of it.
+# Aircraft records are flat objects, so the record is the text between the
+# nearest braces around its id. Returns None when that doesn't work out, and
+# the caller falls back to a full json.loads.
+def scan_aircraft_json(text, aircraft_id):
+    # Only look inside the "aircraft" section; in batched updates the newest
+    # state comes last, so take the last one
+    section = text.rfind('"aircraft"')
+    if section < 0:
+        return None
+    pos = text.find('"id":"' + aircraft_id + '"', section)
+    if pos < 0:
+        pos = text.find('"id": "' + aircraft_id + '"', section)
+        if pos < 0:
+            return None
+    start = text.rfind("{", 0, pos)
+    end = text.find("}", pos)
+    if start < section or end < 0:
+        return None
+    try:
+        record = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    # Anything else carrying our id (e.g. an event after the aircraft) isn't ours
+    if record.get("id") != aircraft_id:
+        return None
+    for key in _AIRCRAFT_KEYS:
+        if key not in record:
+            return None
+    return record
+
+# Advance our aircraft along its last known velocity between server updates
+def dead_reckon(dt):
+    aircraft_data["x"] += aircraft_data["vx"] * dt
+    aircraft_data["y"] += aircraft_data["vy"] * dt
+
 # Connect to WiFi network
 async def connect_wifi():
     print(f"Connecting to WiFi: {WIFI_SSID}")
@@ -102,103 +226,220 @@ async def connect_wifi():
         print(f"IP address: {wlan.ifconfig()[0]}")
         return True
 
+# Text last drawn on each 10-pixel display row; unchanged rows are neither
+# redrawn nor resent over I2C
+DISPLAY_ROW_HEIGHT = 10
+_shown_lines = [None] * 6
+
+# Display text is built with integer math and lookup tables instead of float
+# formatting, which is slow on MicroPython
+_DIGITS = "0123456789"
+_THROTTLE_LINES = tuple("Throttle: " + str(percent) + "%" for percent in range(101))
+
+# Format a value with one decimal place, rounded half away from zero
+def format_tenths(value):
+    tenths = int(value * 10 + (0.5 if value >= 0 else -0.5))
+    if tenths < 0:
+        whole, frac = divmod(-tenths, 10)
+        return "-" + str(whole) + "." + _DIGITS[frac]
+    whole, frac = divmod(tenths, 10)
+    return str(whole) + "." + _DIGITS[frac]
+
 # Update the OLED display with aircraft information
 def update_display():
     if not HAS_DISPLAY:
         return
-        
-    oled.fill(0)
-    oled.text("Flight Simulator", 0, 0)
     
-    if client_id:
-        oled.text(f"ID: {client_id[:8]}", 0, 10)
-    else:
-        oled.text("Not connected", 0, 10)
-        
-    oled.text(f"Alt: {aircraft_data['y']:.1f}m", 0, 20)
-    oled.text(f"Spd: {(aircraft_data['vx']**2 + aircraft_data['vy']**2)**0.5:.1f}m/s", 0, 30)
-    oled.text(f"Pitch: {aircraft_data['theta'] * 57.3:.1f}deg", 0, 40)
-    oled.text(f"Throttle: {aircraft_data['throttle_level']*100:.0f}%", 0, 50)
+    vx = aircraft_data["vx"]
+    vy = aircraft_data["vy"]
+    throttle = int(aircraft_data["throttle_level"] * 100 + 0.5)
+    lines = (
+        "Flight Simulator",
+        "ID: " + client_id[:8] if client_id else "Not connected",
+        "Alt: " + format_tenths(aircraft_data["y"]) + "m",
+        "Spd: " + format_tenths((vx * vx + vy * vy) ** 0.5) + "m/s",
+        "Pitch: " + format_tenths(aircraft_data["theta"] * 57.3) + "deg",
+        _THROTTLE_LINES[min(100, max(0, throttle))],
+    )
     
-    oled.show()
+    # Redraw only the rows whose text changed
+    first = last = -1
+    for row, text in enumerate(lines):
+        if text != _shown_lines[row]:
+            y = row * DISPLAY_ROW_HEIGHT
+            oled.fill_rect(0, y, 128, DISPLAY_ROW_HEIGHT, 0)
+            oled.text(text, 0, y)
+            _shown_lines[row] = text
+            if first < 0:
+                first = row
+            last = row
+    
+    # Flush just the 8-pixel pages covering the changed rows, if any
+    if first >= 0:
+        oled.show(first * DISPLAY_ROW_HEIGHT // 8,
+                  (last * DISPLAY_ROW_HEIGHT + DISPLAY_ROW_HEIGHT - 1) // 8)
 
 # Read input from hardware buttons/joystick
+# Presses are latched: a control stays set until take_input() collects it, so a
+# press shorter than the send loop's period isn't lost between two loop ticks
 def read_input():
-    input_state = {
-        "pitch_up": False,
-        "pitch_down": False,
-        "throttle_up": False,
-        "throttle_down": False
-    }
+    input_state = _INPUT_STATE
     
     # Read buttons (buttons are pulled up, so not pressed = True)
-    input_state["pitch_up"] = not BUTTON_UP.value()
-    input_state["pitch_down"] = not BUTTON_DOWN.value()
-    input_state["throttle_up"] = not BUTTON_THROTTLE_UP.value()
-    input_state["throttle_down"] = not BUTTON_THROTTLE_DOWN.value()
+    if HAS_GPIO_REG:
+        # One MMIO read for all buttons, then mask out each pin's bit
+        pins = mem32[GPIO_IN_REG]
+        input_state["pitch_up"] |= not (pins & MASK_UP)
+        input_state["pitch_down"] |= not (pins & MASK_DOWN)
+        input_state["throttle_up"] |= not (pins & MASK_THROTTLE_UP)
+        input_state["throttle_down"] |= not (pins & MASK_THROTTLE_DOWN)
+    else:
+        input_state["pitch_up"] |= not _read_up()
+        input_state["pitch_down"] |= not _read_down()
+        input_state["throttle_up"] |= not _read_throttle_up()
+        input_state["throttle_down"] |= not _read_throttle_down()
     
     # Read joystick if available
     if HAS_JOYSTICK:
-        # Normalize to -1 to 1 range (assuming middle position is around 2048)
-        joy_y = (JOYSTICK_Y.read() - 2048) / 2048
+        # Offset from the middle position (around 2048); integer math avoids float garbage
+        joy_y = JOYSTICK_Y.read() - 2048
         
-        # Apply a dead zone to avoid drift
-        if abs(joy_y) > 0.2:
-            if joy_y < -0.2:
-                input_state["pitch_up"] = True
-            elif joy_y > 0.2:
-                input_state["pitch_down"] = True
+        # Apply a dead zone (20% of the range) to avoid drift
+        if joy_y < -JOYSTICK_DEAD_ZONE:
+            input_state["pitch_up"] = True
+        elif joy_y > JOYSTICK_DEAD_ZONE:
+            input_state["pitch_down"] = True
+
+# Collect the inputs latched since the last call as a
+# (pitch_up, pitch_down, throttle_up, throttle_down) tuple and reset the latch
+def take_input():
+    input_state = _INPUT_STATE
+    taken = (input_state["pitch_up"], input_state["pitch_down"],
+             input_state["throttle_up"], input_state["throttle_down"])
+    for key in _INPUT_KEYS:
+        input_state[key] = False
     
     # Update LED for throttle
-    LED_THROTTLE.value(1 if input_state["throttle_up"] else 0)
+    _set_throttle_led(1 if taken[2] else 0)
     
-    return input_state
+    return taken
+
+# Sample inputs in a dedicated task so slow network sends don't delay reads.
+# MicroPython has no API for core affinity or task priority; ESP32 firmware
+# already runs the interpreter on core 1, apart from the WiFi stack on core 0.
+async def sample_inputs():
+    while True:
+        read_input()
+        await asyncio.sleep_ms(INPUT_SAMPLE_MS)
+
+# Receive messages in their own task, so the main loop never polls recv() with a timeout
+async def receive_states(websocket, state_event):
+    global client_id
+    
+    while True:
+        message = await websocket.recv()
+        
+        # Process welcome message to get client ID
+        if isinstance(message, str) and message.startswith("Welcome!"):
+            client_id = message.split(":")[1].strip()
+            print(f"Received ID: {client_id}")
+            continue
+        
+        # For JSON text, parse just our aircraft's record when it can be found
+        if client_id and isinstance(message, str):
+            aircraft = scan_aircraft_json(message, client_id)
+            if aircraft is not None:
+                aircraft_data.update(aircraft)
+                state_event.set()
+                continue
+        
+        # Process game state update
+        game_state = decode_message(message)
+        
+        # Delta updates carry only our aircraft's fields that changed
+        delta = game_state.get("delta")
+        if delta is not None:
+            aircraft_data.update(delta)
+            state_event.set()
+            continue
+        
+        # Batched updates carry several states; only the newest matters
+        states = game_state.get("states")
+        if states:
+            game_state = states[-1]
+        
+        # Find our aircraft
+        if client_id and game_state.get("aircraft"):
+            aircraft = find_aircraft(game_state["aircraft"], client_id)
+            if aircraft is not None:
+                aircraft_data.update(aircraft)
+                state_event.set()
 
 # Main WebSocket client loop
 async def ws_client():
-    global client_id, aircraft_data
+    global client_id
     
     while True:
         try:
             # Connect to WebSocket server
-            print(f"Connecting to {SERVER_URL}")
-            async with websockets.connect(SERVER_URL) as websocket:
+            print(f"Connecting to {WS_URL}")
+            async with websockets.connect(WS_URL) as websocket:
                 LED_CONNECTED.value(1)  # Turn on connection LED
                 print("Connected to server")
                 
-                # Process messages
-                while True:
-                    # Check for and process messages from server
-                    try:
-                        message = await asyncio.wait_for(websocket.recv(), 0.1)
-                        
-                        # Process welcome message to get client ID
-                        if message.startswith("Welcome!"):
-                            client_id = message.split(":")[1].strip()
-                            print(f"Received ID: {client_id}")
+                # Set by the receiver whenever fresh aircraft state arrives
+                state_event = asyncio.Event()
+                receiver = asyncio.create_task(receive_states(websocket, state_event))
+                
+                # Input samples waiting for the next batched send
+                pending = []
+                prev_input = None
+                last_send = time.ticks_ms()
+                last_state = last_send
+                next_tick = last_send
+                
+                try:
+                    while not receiver.done():
+                        # Without fresh server state, extrapolate so the display keeps moving
+                        now = time.ticks_ms()
+                        if state_event.is_set():
+                            state_event.clear()
                         else:
-                            # Process game state update
-                            game_state = json.loads(message)
-                            
-                            # Find our aircraft in the list
-                            if client_id and game_state.get("aircraft"):
-                                for aircraft in game_state["aircraft"]:
-                                    if aircraft["id"] == client_id:
-                                        aircraft_data = aircraft
-                                        break
-                    except asyncio.TimeoutError:
-                        # No message received in timeout period, continue
-                        pass
-                    
-                    # Read inputs and send to server
-                    input_state = read_input()
-                    await websocket.send(json.dumps(input_state))
-                    
-                    # Update display
-                    update_display()
+                            dead_reckon(time.ticks_diff(now, last_state) / 1000)
+                        last_state = now
+                        
+                        # Queue inputs only when they change (or as a keepalive while idle)
+                        current = take_input()
+                        idle_ms = time.ticks_diff(now, last_send)
+                        if current != prev_input or idle_ms >= INPUT_KEEPALIVE_MS:
+                            sample = dict(zip(_INPUT_KEYS, current))
+                            sample["t"] = now
+                            pending.append(sample)
+                            prev_input = current
+                        
+                        # Send queued inputs to the server in batches
+                        if pending and idle_ms >= INPUT_BATCH_MS:
+                            await websocket.send(encode_message({"batch": pending}))
+                            pending = []
+                            last_send = now
+                        
+                        # Update display
+                        update_display()
+                        
+                        # Sleep until the next deadline rather than a fixed 50 ms, so
+                        # late wakeups and the work above don't make the loop drift
+                        next_tick = time.ticks_add(next_tick, LOOP_PERIOD_MS)
+                        delay = time.ticks_diff(next_tick, time.ticks_ms())
+                        if delay < -LOOP_PERIOD_MS:
+                            # More than a period behind: resync instead of bursting
+                            next_tick = time.ticks_ms()
+                            delay = 0
+                        await asyncio.sleep_ms(max(0, delay))
                     
-                    # Short delay
-                    await asyncio.sleep(0.05)
+                    # The receiver stopped: re-raise its error to reconnect
+                    await receiver
+                finally:
+                    receiver.cancel()
                     
         except Exception as e:
             print(f"Connection error: {e}")
@@ -209,6 +450,7 @@ async def ws_client():
 # Main function
 async def main():
     if await connect_wifi():
+        asyncio.create_task(sample_inputs())
         await ws_client()
     else:
         while True:
@@ -76,7 +76,10 @@ class SSD1306(framebuf.FrameBuffer):
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
+    def show(self, page0=0, page1=None):
+        # Optionally send only pages page0..page1 (8-pixel rows) of the buffer
+        if page1 is None:
+            page1 = self.pages - 1
         x0 = 0
         x1 = self.width - 1
         if self.width == 64:
@@ -87,9 +90,12 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(x0)
         self.write_cmd(x1)
         self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        self.write_cmd(page0)
+        self.write_cmd(page1)
+        if page0 == 0 and page1 == self.pages - 1:
+            self.write_data(self.buffer)
+        else:
+            self.write_data(memoryview(self.buffer)[page0 * self.width:(page1 + 1) * self.width])
 
 
 class SSD1306_I2C(SSD1306):
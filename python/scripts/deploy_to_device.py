@@ -7,19 +7,25 @@ to ESP32, PyBoard, or other MicroPython-compatible devices.
 
 Usage:
     python deploy_to_device.py [--port PORT] [--device {esp32,pyboard}]
+                               [--no-compile] [--mpy-version VERSION]
 
 Options:
     --port PORT     Serial port of the device (e.g., /dev/ttyUSB0, COM3)
     --device        Target device type (esp32 or pyboard)
+    --no-compile    Deploy library sources instead of mpy-cross bytecode
+    --mpy-version   .mpy version the firmware loads (e.g. 6.2); read from
+                    the device when omitted
 """
 
 import argparse
 import os
+import re
 import shutil
+import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 try:
     import mpremote.main
@@ -36,11 +42,28 @@ except ImportError:
     HAS_AMPY = False
     print("Warning: adafruit-ampy not found. Install with 'pip install adafruit-ampy'")
 
+try:
+    import mpy_cross
+    HAS_MPY_CROSS = True
+except ImportError:
+    HAS_MPY_CROSS = False
+
 
 # Path to the root of the project
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 MICROPYTHON_DIR = PROJECT_ROOT / "micropython"
 
+# An .mpy format version as (version, sub-version), e.g. (6, 2) for "6.2"
+MpyVersion = Tuple[int, int]
+
+
+def parse_mpy_version(text: str) -> MpyVersion:
+    """Parse an .mpy version such as "6" or "6.2"."""
+    match = re.fullmatch(r"(\d+)(?:\.(\d+))?", text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid .mpy version: {text!r}")
+    return int(match.group(1)), int(match.group(2) or 0)
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -62,6 +85,16 @@ def parse_args():
         action="store_true",
         help="Use ampy instead of mpremote",
     )
+    parser.add_argument(
+        "--no-compile",
+        action="store_true",
+        help="Deploy library .py sources instead of precompiled .mpy bytecode",
+    )
+    parser.add_argument(
+        "--mpy-version",
+        type=parse_mpy_version,
+        help=".mpy version the firmware loads, e.g. 6.2 (default: ask the device)",
+    )
     return parser.parse_args()
 
 
@@ -96,32 +129,106 @@ def deploy_with_mpremote(port: str, files_to_deploy: List[Path]):
     
     print(f"Deploying to device at {port} using mpremote...")
     
-    try:
-        # Create lib directory if it doesn't exist
-        mpremote.main.main(["connect", port, "mkdir", "lib"])
-    except Exception:
-        # Directory might already exist, continue
-        pass
+    # Copy everything in one mpremote session so the serial handshake and
+    # raw-REPL entry happen once instead of once per file
+    for file_path in files_to_deploy:
+        print(f"Deploying {file_path.relative_to(MICROPYTHON_DIR)}...")
+    if run_mpremote(build_mpremote_command(port, files_to_deploy)):
+        print("Deployment completed successfully!")
+        return True
+    print("Batched deployment failed, deploying files one at a time...")
+    
+    return deploy_with_mpremote_per_file(port, files_to_deploy)
+
+
+def run_mpremote(command: List[str], quiet: bool = False) -> bool:
+    """Run an mpremote command in a subprocess and report whether it succeeded."""
+    # mpremote.main.main() takes its arguments from sys.argv and signals failure
+    # through its return value, so run the CLI and check the exit status instead
+    result = subprocess.run(
+        [sys.executable, "-m", "mpremote", *command],
+        capture_output=quiet,
+    )
+    return result.returncode == 0
+
+
+def build_mpremote_command(port: str, files_to_deploy: List[Path]) -> List[str]:
+    """Build a single chained mpremote command that deploys all files."""
+    # Every parent directory, shallowest first, created once
+    dirs = {"lib"}
+    for file_path in files_to_deploy:
+        parents = file_path.relative_to(MICROPYTHON_DIR).parent.parts
+        for i in range(1, len(parents) + 1):
+            dirs.add("/".join(parents[:i]))
+    ordered_dirs = sorted(dirs, key=lambda d: (d.count("/"), d))
+    
+    # mkdir on the device itself, ignoring directories that already exist
+    mkdir_code = (
+        "import os\n"
+        f"for d in {ordered_dirs!r}:\n"
+        "    try:\n"
+        "        os.mkdir(d)\n"
+        "    except OSError:\n"
+        "        pass\n"
+    )
+    command = ["connect", port, "exec", mkdir_code]
+    
+    for file_path in files_to_deploy:
+        rel_path = file_path.relative_to(MICROPYTHON_DIR).as_posix()
+        command += ["+", "cp", str(file_path), ":" + rel_path]
+    
+    # After all copies, remove sources that would shadow the new .mpy files,
+    # but only where the .mpy actually made it onto the device
+    stale = stale_sources(files_to_deploy)
+    if stale:
+        cleanup_code = (
+            "import os\n"
+            f"for f in {stale!r}:\n"
+            "    try:\n"
+            "        os.stat(f[:-3] + '.mpy')\n"
+            "        os.remove(f)\n"
+            "    except OSError:\n"
+            "        pass\n"
+        )
+        command += ["+", "exec", cleanup_code]
+    
+    return command
+
+
+def stale_sources(files_to_deploy: List[Path]) -> List[str]:
+    """Device paths of .py sources that would shadow the .mpy files being deployed."""
+    # MicroPython imports foo.py in preference to foo.mpy from the same directory
+    return [
+        file_path.relative_to(MICROPYTHON_DIR).with_suffix(".py").as_posix()
+        for file_path in files_to_deploy
+        if file_path.suffix == ".mpy"
+    ]
+
+
+def deploy_with_mpremote_per_file(port: str, files_to_deploy: List[Path]):
+    """Deploy files using one mpremote invocation per file."""
+    # Create lib directory if it doesn't exist (failure means it already does)
+    run_mpremote(["connect", port, "mkdir", "lib"], quiet=True)
     
     # Deploy each file
     for file_path in files_to_deploy:
         rel_path = file_path.relative_to(MICROPYTHON_DIR)
         print(f"Deploying {rel_path}...")
         
-        # Create parent directories if needed
-        if "/" in str(rel_path):
-            parent_dir = str(rel_path).rsplit("/", 1)[0]
-            try:
-                mpremote.main.main(["connect", port, "mkdir", "-p", parent_dir])
-            except Exception as e:
-                print(f"Warning while creating directories: {e}")
+        # Create parent directories if needed, one level at a time
+        parents = rel_path.parent.parts
+        for i in range(1, len(parents) + 1):
+            run_mpremote(["connect", port, "mkdir", "/".join(parents[:i])], quiet=True)
         
         # Copy the file
-        try:
-            mpremote.main.main(["connect", port, "cp", str(file_path), ":" + str(rel_path)])
-        except Exception as e:
-            print(f"Error deploying {rel_path}: {e}")
+        if not run_mpremote(["connect", port, "cp", str(file_path), ":" + rel_path.as_posix()]):
+            print(f"Error deploying {rel_path}")
             return False
+        
+        # Now that the .mpy is in place, remove the old source that would shadow it
+        # (failure just means there was nothing to remove)
+        if file_path.suffix == ".mpy":
+            run_mpremote(["connect", port, "rm", rel_path.with_suffix(".py").as_posix()], quiet=True)
     
     print("Deployment completed successfully!")
     return True
@@ -173,6 +280,14 @@ def deploy_with_ampy(port: str, files_to_deploy: List[Path]):
             except Exception as e:
                 print(f"Error deploying {rel_path}: {e}")
                 return False
+            
+            # Now that the .mpy is in place, remove the old source that would shadow it
+            if file_path.suffix == ".mpy":
+                try:
+                    files.rm(rel_path[:-4] + ".py")
+                except Exception:
+                    # Nothing to remove
+                    pass
         
         print("Deployment completed successfully!")
         return True
@@ -195,6 +310,12 @@ def collect_files_to_deploy(device_type: str) -> List[Path]:
     for file_path in lib_dir.glob("**/*.py"):
         files.append(file_path)
     
+    # The client speaks MessagePack when umsgpack is available on the device
+    if not any(path.stem == "umsgpack" or path.parent.name == "umsgpack" for path in files):
+        print("Warning: umsgpack not found in micropython/lib; the client will fall back to JSON.")
+        print("Vendor it into micropython/lib or install it on the device with")
+        print("'mpremote mip install github:peterhinch/micropython-msgpack'")
+    
     # Device-specific configuration file if it exists
     config_file = MICROPYTHON_DIR / f"config_{device_type}.py"
     if config_file.exists():
@@ -203,6 +324,110 @@ def collect_files_to_deploy(device_type: str) -> List[Path]:
     return files
 
 
+def get_device_mpy_version(port: str, use_ampy: bool) -> Optional[MpyVersion]:
+    """Ask the device which .mpy version its firmware loads."""
+    # sys.implementation._mpy: low byte is the version, bits 8-9 the sub-version
+    code = (
+        "import sys\n"
+        "m = getattr(sys.implementation, '_mpy', 0)\n"
+        "print('MPY', m & 0xFF, (m >> 8) & 3)\n"
+    )
+    try:
+        if use_ampy:
+            board = Pyboard(port)
+            board.enter_raw_repl()
+            output = board.exec(code).decode("utf-8")
+            board.exit_raw_repl()
+            board.close()
+        else:
+            result = subprocess.run(
+                [sys.executable, "-m", "mpremote", "connect", port, "exec", code],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            output = result.stdout
+    except Exception as e:
+        print(f"Warning: could not read the .mpy version from the device: {e}")
+        return None
+    
+    match = re.search(r"MPY (\d+) (\d+)", output)
+    if not match or match.group(1) == "0":
+        # Firmware without .mpy support reports no version
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def run_mpy_cross(args: List[str]) -> Tuple[int, str]:
+    """Run mpy-cross from PATH or the mpy_cross package, returning (returncode, output)."""
+    mpy_cross_bin = shutil.which("mpy-cross")
+    if mpy_cross_bin is not None:
+        result = subprocess.run([mpy_cross_bin] + args, capture_output=True, text=True)
+        return result.returncode, result.stdout + result.stderr
+    process = mpy_cross.run(*args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    output, _ = process.communicate()
+    return process.returncode, output
+
+
+def get_mpy_cross_version() -> Optional[MpyVersion]:
+    """The .mpy version mpy-cross emits, from its --version banner."""
+    returncode, output = run_mpy_cross(["--version"])
+    match = re.search(r"mpy v(\d+)(?:\.(\d+))?", output)
+    if returncode != 0 or not match:
+        return None
+    return int(match.group(1)), int(match.group(2) or 0)
+
+
+def compile_to_mpy(files_to_deploy: List[Path], target_version: Optional[MpyVersion]) -> List[Path]:
+    """Precompile library modules to .mpy bytecode with mpy-cross.
+    
+    The device then skips parsing and compiling them on import, which saves
+    heap and boot time. client.py and the device config stay as sources,
+    since they are run or edited on the device directly.
+    
+    Firmware refuses .mpy files of any other version than its own, so the
+    modules are only compiled when mpy-cross emits exactly target_version.
+    """
+    if shutil.which("mpy-cross") is None and not HAS_MPY_CROSS:
+        print("Warning: mpy-cross not found, deploying library sources. "
+              "Install with 'pip install mpy-cross'")
+        return files_to_deploy
+    
+    if target_version is None:
+        print("Warning: the device's .mpy version is unknown, deploying library sources. "
+              "Pass --mpy-version to compile anyway")
+        return files_to_deploy
+    
+    cross_version = get_mpy_cross_version()
+    if cross_version != target_version:
+        emitted = "an unknown version" if cross_version is None else "v%d.%d" % cross_version
+        print(f"Warning: mpy-cross emits {emitted} but the device loads "
+              f"v{target_version[0]}.{target_version[1]}, deploying library sources. "
+              "Install a matching mpy-cross (e.g. 'pip install mpy-cross==<firmware version>')")
+        return files_to_deploy
+    
+    lib_dir = MICROPYTHON_DIR / "lib"
+    compiled = []
+    for file_path in files_to_deploy:
+        if lib_dir not in file_path.parents:
+            compiled.append(file_path)
+            continue
+        
+        # The .mpy is written next to its source so it deploys to the same place
+        mpy_path = file_path.with_suffix(".mpy")
+        returncode, output = run_mpy_cross(["-O2", "-o", str(mpy_path), str(file_path)])
+        
+        if returncode == 0:
+            compiled.append(mpy_path)
+        else:
+            print(output.rstrip())
+            print(f"Warning: mpy-cross failed on {file_path.relative_to(MICROPYTHON_DIR)}, "
+                  "deploying the source instead")
+            compiled.append(file_path)
+    
+    return compiled
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -226,6 +451,14 @@ def main():
     
     print(f"Found {len(files_to_deploy)} files to deploy...")
     
+    # Precompile library modules unless sources were requested, for the .mpy
+    # version the firmware actually loads
+    if not args.no_compile:
+        target_version = args.mpy_version
+        if target_version is None:
+            target_version = get_device_mpy_version(port, args.use_ampy or not HAS_MPREMOTE)
+        files_to_deploy = compile_to_mpy(files_to_deploy, target_version)
+    
     # Deploy files using the preferred method
     if args.use_ampy or not HAS_MPREMOTE:
         success = deploy_with_ampy(port, files_to_deploy)
@@ -241,7 +474,8 @@ def main():
     # Reset the device to run the new code
     try:
         if HAS_MPREMOTE and not args.use_ampy:
-            mpremote.main.main(["connect", port, "reset"])
+            if not run_mpremote(["connect", port, "reset"]):
+                raise RuntimeError("mpremote reset failed")
         else:
             # Try to reset using ampy or manually
             try:
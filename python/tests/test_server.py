@@ -4,18 +4,22 @@ Test suite for the Flight Simulator server.
 These tests ensure that the server can handle connections and manage aircraft state properly.
 """
 
-import asyncio
+import itertools
 import json
 import os
 import socket
+import struct
 import subprocess
 import time
+import zlib
 from pathlib import Path
-from typing import AsyncGenerator, Dict, List, Optional, Tuple
+from typing import Dict, Generator, List, Optional, Tuple, cast
 
+import msgpack
 import pytest
-import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.protocol import State
+from websockets.sync.client import connect
+from websockets.sync.connection import Connection
 
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -23,10 +27,15 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 # Server process
 SERVER_PROCESS: Optional[subprocess.Popen] = None
 SERVER_PORT = 8081  # Use a different port than default to avoid conflicts
+# Ask for binary MessagePack frames, like the MicroPython client does
+SERVER_URL = f"ws://localhost:{SERVER_PORT}/ws?format=msgpack"
+# No permessage-deflate: its zlib state is kept per connection. The server may
+# instead compress each broadcast once and send the same bytes to every client.
+COMPRESSION = None
 
 
 @pytest.fixture(scope="session", autouse=True)
-async def server_setup():
+def server_setup():
     """Start the server before tests and stop it after."""
     # Start the server in a subprocess
     global SERVER_PROCESS
@@ -49,13 +58,16 @@ async def server_setup():
         stderr=subprocess.PIPE,
     )
     
-    # Wait for server to start
+    # Wait for server to start, polling with exponential backoff
     server_ready = False
-    for _ in range(30):  # Wait up to 3 seconds
+    deadline = time.monotonic() + 3.0  # Wait up to 3 seconds
+    delay = 0.02
+    while time.monotonic() < deadline:
         if is_port_in_use(SERVER_PORT):
             server_ready = True
             break
-        await asyncio.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
     
     if not server_ready:
         # Read any output from the server to help diagnose the issue
@@ -78,123 +90,164 @@ async def server_setup():
             SERVER_PROCESS.kill()
 
 
+def make_probe_socket() -> socket.socket:
+    """Create a socket for port probing that doesn't leave TIME_WAIT entries behind."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Linger with a zero timeout: close() resets the connection instead of lingering
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    return s
+
+
 def is_port_in_use(port: int) -> bool:
-    """Check if a port is in use."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+    """Check if a port is in use with a fresh probe socket."""
+    # A socket's state is unspecified after a failed connect (BSD/macOS then
+    # fail every retry with EINVAL), so each attempt gets its own socket
+    with make_probe_socket() as s:
         return s.connect_ex(('localhost', port)) == 0
 
 
+# Every combination of the four input flags, encoded once at import time
+# (packb is typed as returning bytes | None, but always returns bytes here)
+_INPUT_CACHE: Dict[Tuple[bool, ...], bytes] = {
+    flags: cast(bytes, msgpack.packb(dict(zip(
+        ("pitch_up", "pitch_down", "throttle_up", "throttle_down"), flags
+    ))))
+    for flags in itertools.product((False, True), repeat=4)
+}
+
+
 @pytest.fixture
-async def client() -> AsyncGenerator[WebSocketClientProtocol, None]:
+def client() -> Generator[Connection, None, None]:
     """Create a WebSocket client connected to the server."""
-    async with websockets.connect(f"ws://localhost:{SERVER_PORT}/ws") as websocket:
+    with connect(SERVER_URL, compression=COMPRESSION) as websocket:
         # Wait for welcome message
-        welcome_msg = await websocket.recv()
-        assert "Welcome!" in welcome_msg
+        recv_welcome(websocket)
         yield websocket
 
 
-async def send_input(ws: WebSocketClientProtocol, 
-                     pitch_up: bool = False, 
-                     pitch_down: bool = False,
-                     throttle_up: bool = False,
-                     throttle_down: bool = False) -> None:
+def recv_welcome(ws: Connection) -> str:
+    """Receive the server's text welcome message."""
+    welcome_msg = ws.recv()
+    assert isinstance(welcome_msg, str) and "Welcome!" in welcome_msg
+    return welcome_msg
+
+
+def send_input(ws: Connection, 
+               pitch_up: bool = False, 
+               pitch_down: bool = False,
+               throttle_up: bool = False,
+               throttle_down: bool = False) -> None:
     """Send input to the server."""
-    input_data = {
-        "pitch_up": pitch_up,
-        "pitch_down": pitch_down,
-        "throttle_up": throttle_up,
-        "throttle_down": throttle_down
-    }
-    await ws.send(json.dumps(input_data))
+    # Same MessagePack encoding as the MicroPython client, prepared in advance
+    ws.send(_INPUT_CACHE[(pitch_up, pitch_down, throttle_up, throttle_down)])
 
 
-async def get_game_state(ws: WebSocketClientProtocol, timeout: float = 1.0) -> Dict:
+def decode_message(message) -> Dict:
+    """Decode a server message: binary frames are MessagePack, text frames JSON."""
+    if isinstance(message, bytes):
+        # Payloads compressed once per broadcast start with a zlib header
+        if message[:1] == b"\x78":
+            message = zlib.decompress(message)
+        if message[:1] == b"{":
+            return json.loads(message)
+        return msgpack.unpackb(message)
+    return json.loads(message)
+
+
+def get_game_state(ws: Connection, timeout: float = 1.0) -> Dict:
     """Get the current game state from the server."""
     try:
         # Wait for state update
-        state_json = await asyncio.wait_for(ws.recv(), timeout)
-        state = json.loads(state_json)
-        return state
-    except asyncio.TimeoutError:
+        message = ws.recv(timeout)
+        return decode_message(message)
+    except TimeoutError:
         pytest.fail("Timed out waiting for game state")
 
 
-@pytest.mark.asyncio
-async def test_connection(client: WebSocketClientProtocol):
+# Index of the most recently searched state, so repeated lookups in it are O(1)
+_last_indexed: Tuple[Optional[Dict], Dict[str, Dict]] = (None, {})
+
+
+def find_aircraft(state: Dict, aircraft_id: str) -> Optional[Dict]:
+    """Find an aircraft by id, indexing the state's aircraft once."""
+    global _last_indexed
+    indexed_state, by_id = _last_indexed
+    if indexed_state is not state:
+        aircraft = state["aircraft"]
+        # Accept aircraft already keyed by id as well as a list of records
+        by_id = aircraft if isinstance(aircraft, dict) else {a["id"]: a for a in aircraft}
+        _last_indexed = (state, by_id)
+    return by_id.get(aircraft_id)
+
+
+def wait_until_state(ws: Connection, predicate, timeout: float = 1.0) -> Dict:
+    """Consume state updates until predicate(state) holds, instead of sleeping a fixed time."""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            pytest.fail(f"Timed out waiting for a state where {predicate.__name__} holds")
+        state = get_game_state(ws, remaining)
+        if predicate(state):
+            return state
+
+
+def test_connection(client: Connection):
     """Test that the client can connect to the server."""
     # Connection is established in the fixture
-    assert client.open
+    assert client.protocol.state is State.OPEN
 
 
-@pytest.mark.asyncio
-async def test_throttle_control(client: WebSocketClientProtocol):
+def test_throttle_control(client: Connection):
     """Test that throttle control works."""
     # Get initial state
-    initial_state = await get_game_state(client)
+    initial_state = get_game_state(client)
     
     # Find our aircraft
     our_aircraft = initial_state["aircraft"][0]
     initial_throttle = our_aircraft["throttle_level"]
     
     # Send throttle up command
-    await send_input(client, throttle_up=True)
-    
-    # Wait for a few frames to ensure the input is processed
-    await asyncio.sleep(0.2)
+    send_input(client, throttle_up=True)
     
-    # Get updated state
-    updated_state = await get_game_state(client)
+    # Throttle should increase once the input has been processed
+    def throttle_increased(state: Dict) -> bool:
+        aircraft = find_aircraft(state, our_aircraft["id"])
+        return aircraft is not None and aircraft["throttle_level"] > initial_throttle
     
-    # Find our aircraft again
-    for aircraft in updated_state["aircraft"]:
-        if aircraft["id"] == our_aircraft["id"]:
-            # Throttle should have increased
-            assert aircraft["throttle_level"] > initial_throttle
-            break
-    else:
-        pytest.fail("Couldn't find our aircraft in updated state")
+    wait_until_state(client, throttle_increased)
 
 
-@pytest.mark.asyncio
-async def test_pitch_control(client: WebSocketClientProtocol):
+def test_pitch_control(client: Connection):
     """Test that pitch control works."""
     # Get initial state
-    initial_state = await get_game_state(client)
+    initial_state = get_game_state(client)
     
     # Find our aircraft
     our_aircraft = initial_state["aircraft"][0]
     initial_theta = our_aircraft["theta"]
     
     # Send pitch up command
-    await send_input(client, pitch_up=True)
-    
-    # Wait for a few frames
-    await asyncio.sleep(0.2)
+    send_input(client, pitch_up=True)
     
-    # Get updated state
-    updated_state = await get_game_state(client)
+    # Pitch should increase (become more positive) once the input has been processed
+    def pitch_increased(state: Dict) -> bool:
+        aircraft = find_aircraft(state, our_aircraft["id"])
+        return aircraft is not None and aircraft["theta"] > initial_theta
     
-    # Find our aircraft again
-    for aircraft in updated_state["aircraft"]:
-        if aircraft["id"] == our_aircraft["id"]:
-            # Pitch should have increased (become more positive)
-            assert aircraft["theta"] > initial_theta
-            break
-    else:
-        pytest.fail("Couldn't find our aircraft in updated state")
+    wait_until_state(client, pitch_increased)
 
 
-@pytest.mark.asyncio
-async def test_multiple_clients():
+def test_multiple_clients():
     """Test that multiple clients can connect and control separate aircraft."""
     # Connect two clients
-    async with websockets.connect(f"ws://localhost:{SERVER_PORT}/ws") as client1, \
-               websockets.connect(f"ws://localhost:{SERVER_PORT}/ws") as client2:
+    with connect(SERVER_URL, compression=COMPRESSION) as client1, \
+         connect(SERVER_URL, compression=COMPRESSION) as client2:
         
         # Get welcome messages to extract IDs
-        welcome1 = await client1.recv()
-        welcome2 = await client2.recv()
+        welcome1 = recv_welcome(client1)
+        welcome2 = recv_welcome(client2)
         
         # Extract client IDs
         client1_id = welcome1.split(":")[1].strip()
@@ -204,40 +257,25 @@ async def test_multiple_clients():
         assert client1_id != client2_id
         
         # Get initial states
-        state1 = await get_game_state(client1)
-        state2 = await get_game_state(client2)
+        state1 = get_game_state(client1)
+        state2 = get_game_state(client2)
         
         # Should have same number of aircraft (2)
         assert len(state1["aircraft"]) == 2
         assert len(state2["aircraft"]) == 2
         
         # Apply different controls to each client
-        await send_input(client1, throttle_up=True)
-        await send_input(client2, pitch_up=True)
-        
-        # Wait for inputs to take effect
-        await asyncio.sleep(0.3)
-        
-        # Get updated states
-        updated_state1 = await get_game_state(client1)
-        updated_state2 = await get_game_state(client2)
-        
-        # Find aircraft by ID
-        client1_aircraft = None
-        client2_aircraft = None
-        
-        for aircraft in updated_state1["aircraft"]:
-            if aircraft["id"] == client1_id:
-                client1_aircraft = aircraft
-            elif aircraft["id"] == client2_id:
-                client2_aircraft = aircraft
-        
-        # Verify each aircraft has been affected by its controls
-        assert client1_aircraft is not None
-        assert client2_aircraft is not None
+        send_input(client1, throttle_up=True)
+        send_input(client2, pitch_up=True)
         
-        # Client 1 should have higher throttle
-        assert client1_aircraft["throttle_level"] > 0
+        # Each aircraft should be affected by its own controls: client 1 gets
+        # throttle, client 2 gets positive pitch
+        def both_applied(state: Dict) -> bool:
+            aircraft1 = find_aircraft(state, client1_id)
+            aircraft2 = find_aircraft(state, client2_id)
+            return (
+                aircraft1 is not None and aircraft1["throttle_level"] > 0
+                and aircraft2 is not None and aircraft2["theta"] > 0
+            )
         
-        # Client 2 should have positive pitch
-        assert client2_aircraft["theta"] > 0 
\ No newline at end of file
+        wait_until_state(client1, both_applied) 
\ No newline at end of file